@@ -52,12 +52,7 @@ impl TestContext {
         let python_version =
             std::env::var(ToolEnvVars::PYTHON_VERSION).unwrap_or_else(|_| "3.13".to_string());
 
-        let karva_wheel = karva_project::find_karva_wheel()
-            .expect("Could not find karva wheel. Run `maturin build` before running tests.")
-            .to_string();
-
-        let venv_path =
-            get_or_create_shared_venv(&cache_dir, &python_version, &karva_wheel).clone();
+        let venv_path = get_or_create_shared_venv(&cache_dir, &python_version).clone();
 
         let mut settings = Settings::clone_current();
 
@@ -241,14 +236,15 @@ pub fn get_test_cache_dir() -> Utf8PathBuf {
 ///
 /// The shared venv is stored in the cache directory and reused across all tests.
 /// Uses file locking to coordinate venv creation across parallel test processes.
-fn get_or_create_shared_venv(
-    cache_dir: &Utf8Path,
-    python_version: &str,
-    karva_wheel_path: &str,
-) -> &'static Utf8PathBuf {
+/// The karva wheel is located here, so its directory is scanned once per process.
+fn get_or_create_shared_venv(cache_dir: &Utf8Path, python_version: &str) -> &'static Utf8PathBuf {
     SHARED_VENV.get_or_init(|| {
         let start = Instant::now();
 
+        let karva_wheel = karva_project::find_karva_wheel()
+            .expect("Could not find karva wheel. Run `maturin build` before running tests.");
+        let karva_wheel_path = karva_wheel.as_str();
+
         // Include wheel modification time in the venv name to invalidate when wheel changes
         let wheel_mtime = std::fs::metadata(karva_wheel_path)
             .and_then(|m| m.modified())
@@ -1,3 +1,5 @@
+use std::sync::LazyLock;
+
 use insta::assert_snapshot;
 use insta_cmd::assert_cmd_snapshot;
 use regex::Regex;
@@ -5,16 +7,18 @@ use regex::Regex;
 use crate::common::TestContext;
 
 fn normalize_junit_xml(xml: &str) -> String {
-    Regex::new(r#"time="[0-9.]+""#)
-        .expect("valid time regex")
-        .replace_all(xml, r#"time="[TIME]""#)
-        .to_string()
+    static TIME: LazyLock<Regex> =
+        LazyLock::new(|| Regex::new(r#"time="[0-9.]+""#).expect("valid time regex"));
+
+    TIME.replace_all(xml, r#"time="[TIME]""#).to_string()
 }
 
 fn normalize_junit_xml_with_min_duration(xml: &str, minimum: f64) -> String {
-    let test_case_time =
-        Regex::new(r#"(<testcase [^>]*time=")([0-9.]+)(")"#).expect("valid testcase time regex");
-    let xml = test_case_time.replace_all(xml, |captures: &regex::Captures<'_>| {
+    static TEST_CASE_TIME: LazyLock<Regex> = LazyLock::new(|| {
+        Regex::new(r#"(<testcase [^>]*time=")([0-9.]+)(")"#).expect("valid testcase time regex")
+    });
+
+    let xml = TEST_CASE_TIME.replace_all(xml, |captures: &regex::Captures<'_>| {
         let duration = captures[2]
             .parse::<f64>()
             .expect("testcase duration should be numeric");
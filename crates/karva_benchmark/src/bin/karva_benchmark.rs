@@ -9,7 +9,7 @@
 use std::io::Write as _;
 use std::num::NonZeroUsize;
 use std::path::PathBuf;
-use std::process::{Command, Output};
+use std::process::{Command, Output, Stdio};
 use std::sync::LazyLock;
 #[cfg(target_os = "linux")]
 use std::time::Instant;
@@ -649,6 +649,9 @@ fn run_project_cli(
             .args(["--quiet", "-f", "%M", "-o", report_path.as_str()])
             .arg(invocation.binary.as_str())
             .args(&invocation.args)
+            // Per-test output is only needed by the separate diagnostic run, so
+            // keep the measured run from piping and buffering it.
+            .stdout(Stdio::null())
             .output()
             .context("Failed to execute `/usr/bin/time` for memory benchmark")?;
         let elapsed = start.elapsed();
@@ -731,12 +734,20 @@ impl KarvaInvocation {
 }
 
 fn ensure_karva_completed(output: &Output, config: &BenchmarkProject) -> Result<()> {
+    let stdout = String::from_utf8_lossy(&output.stdout);
+    // Measured runs send stdout to the null device, so say so rather than
+    // printing an empty section.
+    let stdout = if stdout.is_empty() {
+        "<empty; measured runs discard stdout>"
+    } else {
+        stdout.as_ref()
+    };
     anyhow::ensure!(
         is_benchmarkable_exit(output.status.code()),
         "Karva exited with status {} for `{}`\nstdout:\n{}\nstderr:\n{}",
         output.status,
         config.name,
-        String::from_utf8_lossy(&output.stdout),
+        stdout,
         String::from_utf8_lossy(&output.stderr),
     );
 
@@ -6,6 +6,8 @@ use anyhow::{Context, Result};
 use camino::Utf8Path;
 use fs_err as fs;
 
+use super::push_repeated_tests;
+
 // Receipt: 128 fixtures across 1,024 tests ran in 2.91 s at 54.2 MiB peak RSS
 // on arm64 macOS with a local debug wheel on 2026-08-04.
 pub(super) const FIXTURES: usize = 128;
@@ -28,29 +30,28 @@ pub(super) fn generate(tests: &Utf8Path) -> Result<()> {
         fixtures,
         "@pytest.fixture\ndef fixture_0():\n    return 0\n"
     )?;
+    // Each fixture depends on every earlier one, so extend a single parameter
+    // list instead of re-rendering all earlier names for every fixture.
+    let mut dependencies = String::from("fixture_0");
     for fixture in 1..FIXTURES {
-        let dependencies = (0..fixture)
-            .map(|dependency| format!("fixture_{dependency}"))
-            .collect::<Vec<_>>()
-            .join(", ");
         writeln!(
             fixtures,
             "@pytest.fixture\ndef fixture_{fixture}({dependencies}):\n    return {fixture}\n"
         )?;
+        write!(dependencies, ", fixture_{fixture}")?;
     }
     fs::write(tests.join("conftest.py"), fixtures)
         .context("Failed to write generated dense fixtures")?;
 
+    let last = FIXTURES - 1;
     let mut source = String::new();
-    for case in 0..TESTS {
-        writeln!(
-            source,
-            "def test_dense_fixtures_{case}(fixture_{}):\n    assert fixture_{} == {}\n",
-            FIXTURES - 1,
-            FIXTURES - 1,
-            FIXTURES - 1,
-        )?;
-    }
+    push_repeated_tests(
+        &mut source,
+        "test_dense_fixtures",
+        TESTS,
+        &format!("fixture_{last}"),
+        &format!("    assert fixture_{last} == {last}\n"),
+    )?;
     fs::write(tests.join("test_dense_fixtures.py"), source)
         .context("Failed to write generated dense fixture tests")?;
 
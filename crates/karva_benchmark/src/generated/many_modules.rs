@@ -6,6 +6,8 @@ use anyhow::{Context, Result};
 use camino::Utf8Path;
 use fs_err as fs;
 
+use super::push_repeated_tests;
+
 // Receipt: 8,192 modules with one test each ran in 1.36 s at 124.1 MiB peak
 // RSS on arm64 macOS with a local debug wheel on 2026-08-04. Using 2,048
 // modules with eight tests each exceeded the macOS process argument limit.
@@ -20,12 +22,25 @@ pub(super) const TESTS_PER_MODULE: usize = 1;
 ///   test_1.py  # test_1_0, test_1_1
 /// ```
 pub(super) fn generate(tests: &Utf8Path) -> Result<()> {
+    // The module stem doubles as the test name prefix, and both it and the
+    // module path are rewritten in place rather than reallocated per module.
+    let mut name = String::new();
+    let mut path = tests.join("test.py");
+    let mut source = String::new();
     for module in 0..MODULES {
-        let mut source = String::new();
-        for case in 0..TESTS_PER_MODULE {
-            writeln!(source, "def test_{module}_{case}():\n    assert True\n")?;
-        }
-        fs::write(tests.join(format!("test_{module}.py")), source)
+        name.clear();
+        write!(name, "test_{module}")?;
+        source.clear();
+        push_repeated_tests(
+            &mut source,
+            &name,
+            TESTS_PER_MODULE,
+            "",
+            "    assert True\n",
+        )?;
+        path.set_file_name(&name);
+        path.set_extension("py");
+        fs::write(&path, &source)
             .with_context(|| format!("Failed to write generated test module {module}"))?;
     }
 
@@ -1,5 +1,8 @@
 //! Deterministic projects targeting specific expensive Karva subsystems.
 
+use std::fmt::Write;
+use std::io::ErrorKind;
+
 use anyhow::{Context, Result};
 use camino::Utf8Path;
 use fs_err as fs;
@@ -47,8 +50,12 @@ pub enum GeneratedBenchmark {
 /// ```
 pub fn generate_project(workload: GeneratedBenchmark, project_root: &Utf8Path) -> Result<()> {
     let tests = project_root.join("tests");
-    if tests.exists() {
-        fs::remove_dir_all(&tests).context("Failed to clear generated benchmark tests")?;
+    match fs::remove_dir_all(&tests) {
+        Ok(()) => {}
+        Err(error) if error.kind() == ErrorKind::NotFound => {}
+        Err(error) => {
+            return Err(error).context("Failed to clear generated benchmark tests");
+        }
     }
     fs::create_dir_all(&tests).context("Failed to create generated benchmark tests")?;
     let retry = if matches!(workload, GeneratedBenchmark::Retries) {
@@ -75,6 +82,32 @@ pub fn generate_project(workload: GeneratedBenchmark, project_root: &Utf8Path) -
     }
 }
 
+// Reserve hint for the bytes each test adds beyond its name, parameters and
+// body: 10 fixed bytes (`def `, `_`, `(`, `):\n` and the blank separator
+// line) plus the case index digits, with slack.
+const REPEATED_TEST_OVERHEAD: usize = 16;
+
+/// Appends `count` tests that differ only by the numeric suffix on `name`.
+///
+/// Every test shares `parameters` and the newline-terminated `body`, so callers
+/// format them once rather than once per test.
+fn push_repeated_tests(
+    source: &mut String,
+    name: &str,
+    count: usize,
+    parameters: &str,
+    body: &str,
+) -> std::fmt::Result {
+    source.reserve(count * (name.len() + parameters.len() + body.len() + REPEATED_TEST_OVERHEAD));
+    for case in 0..count {
+        writeln!(source, "def {name}_{case}({parameters}):")?;
+        source.push_str(body);
+        source.push('\n');
+    }
+
+    Ok(())
+}
+
 #[cfg(test)]
 mod tests {
     use camino::Utf8Path;
@@ -6,6 +6,8 @@ use anyhow::{Context, Result};
 use camino::Utf8Path;
 use fs_err as fs;
 
+use super::push_repeated_tests;
+
 // Receipt: 512 fixtures across 4,096 tests ran in 1.99 s at 84.9 MiB peak RSS
 // on arm64 macOS with a local debug wheel on 2026-08-04.
 pub(super) const DEPTH: usize = 512;
@@ -39,16 +41,15 @@ pub(super) fn generate(tests: &Utf8Path) -> Result<()> {
     fs::write(tests.join("conftest.py"), fixtures)
         .context("Failed to write generated nested fixtures")?;
 
+    let last = DEPTH - 1;
     let mut source = String::new();
-    for case in 0..TESTS {
-        writeln!(
-            source,
-            "def test_nested_fixtures_{case}(fixture_{}):\n    assert fixture_{} == {}\n",
-            DEPTH - 1,
-            DEPTH - 1,
-            DEPTH - 1,
-        )?;
-    }
+    push_repeated_tests(
+        &mut source,
+        "test_nested_fixtures",
+        TESTS,
+        &format!("fixture_{last}"),
+        &format!("    assert fixture_{last} == {last}\n"),
+    )?;
     fs::write(tests.join("test_nested_fixtures.py"), source)
         .context("Failed to write generated nested fixture tests")?;
 
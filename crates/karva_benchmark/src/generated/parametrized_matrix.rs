@@ -22,15 +22,12 @@ pub(super) const VALUES: usize = 7;
 /// # Eight test cases.
 /// ```
 pub(super) fn generate(tests: &Utf8Path) -> Result<()> {
-    let values = (0..VALUES).collect::<Vec<_>>();
+    let values = format!("{:?}", (0..VALUES).collect::<Vec<_>>());
     let mut parameters = Vec::with_capacity(PARAMETRIZE_DECORATORS);
     let mut source = String::from("import pytest\n\n");
     for parameter in 0..PARAMETRIZE_DECORATORS {
         let parameter = format!("parameter_{parameter}");
-        writeln!(
-            source,
-            "@pytest.mark.parametrize({parameter:?}, {values:?})"
-        )?;
+        writeln!(source, "@pytest.mark.parametrize({parameter:?}, {values})")?;
         parameters.push(parameter);
     }
     writeln!(
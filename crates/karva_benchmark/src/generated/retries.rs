@@ -1,11 +1,11 @@
 //! Generated workload for flaky test re-execution and result tracking.
 
-use std::fmt::Write;
-
 use anyhow::{Context, Result};
 use camino::Utf8Path;
 use fs_err as fs;
 
+use super::push_repeated_tests;
+
 // Receipt: 4,096 tests passing on their second attempt ran in 1.31 s at
 // 53.9 MiB peak RSS on arm64 macOS with a local debug wheel on 2026-08-04.
 pub(super) const CASES: usize = 4_096;
@@ -18,12 +18,13 @@ pub(super) const CASES: usize = 4_096;
 /// ```
 pub(super) fn generate(tests: &Utf8Path) -> Result<()> {
     let mut source = String::from("import os\n\n");
-    for case in 0..CASES {
-        writeln!(
-            source,
-            "def test_retry_{case}():\n    assert int(os.environ[\"KARVA_ATTEMPT\"]) > 1\n"
-        )?;
-    }
+    push_repeated_tests(
+        &mut source,
+        "test_retry",
+        CASES,
+        "",
+        "    assert int(os.environ[\"KARVA_ATTEMPT\"]) > 1\n",
+    )?;
     fs::write(tests.join("test_retries.py"), source)
         .context("Failed to write generated retry tests")?;
 
@@ -6,6 +6,8 @@ use anyhow::{Context, Result};
 use camino::Utf8Path;
 use fs_err as fs;
 
+use super::push_repeated_tests;
+
 // Receipt: 4,096 tests each made 256 comparisons of a 2,048-line snapshot and
 // ran in 1.48 s at 52.0 MiB peak RSS on arm64 macOS with a local debug wheel
 // on 2026-08-04.
@@ -23,18 +25,24 @@ pub(super) const ASSERTIONS_PER_TEST: usize = 256;
 ///         karva.assert_snapshot(VALUE, inline=SNAPSHOT)
 /// ```
 pub(super) fn generate(tests: &Utf8Path) -> Result<()> {
-    let snapshot = (0..LINES)
-        .map(|line| format!("record {line:03}: αβγ/\\/\"quoted\""))
-        .collect::<Vec<_>>()
-        .join("\\n");
+    let mut snapshot = String::new();
+    for line in 0..LINES {
+        if line > 0 {
+            snapshot.push_str("\\n");
+        }
+        write!(snapshot, "record {line:03}: αβγ/\\/\"quoted\"")?;
+    }
     let mut source =
         format!("import karva\n\nSNAPSHOT = {snapshot:?}\nVALUE = SNAPSHOT.encode().decode()\n\n");
-    for case in 0..CASES {
-        writeln!(
-            source,
-            "def test_snapshot_{case}():\n    for _ in range({ASSERTIONS_PER_TEST}):\n        karva.assert_snapshot(VALUE, inline=SNAPSHOT)\n"
-        )?;
-    }
+    push_repeated_tests(
+        &mut source,
+        "test_snapshot",
+        CASES,
+        "",
+        &format!(
+            "    for _ in range({ASSERTIONS_PER_TEST}):\n        karva.assert_snapshot(VALUE, inline=SNAPSHOT)\n"
+        ),
+    )?;
     fs::write(tests.join("test_snapshots.py"), source)
         .context("Failed to write generated snapshot tests")?;
 
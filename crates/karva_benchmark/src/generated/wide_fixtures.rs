@@ -6,6 +6,8 @@ use anyhow::{Context, Result};
 use camino::Utf8Path;
 use fs_err as fs;
 
+use super::push_repeated_tests;
+
 // Receipt: 64 fixtures across 4,096 tests ran in 3.06 s at 138.7 MiB peak RSS
 // on arm64 macOS with a local debug wheel on 2026-08-04.
 pub(super) const FIXTURES: usize = 64;
@@ -37,14 +39,13 @@ pub(super) fn generate(tests: &Utf8Path) -> Result<()> {
         .collect::<Vec<_>>();
     let expected = (0..FIXTURES).sum::<usize>();
     let mut source = String::new();
-    for case in 0..TESTS {
-        writeln!(
-            source,
-            "def test_wide_fixtures_{case}({}):\n    assert {} == {expected}\n",
-            arguments.join(", "),
-            arguments.join(" + "),
-        )?;
-    }
+    push_repeated_tests(
+        &mut source,
+        "test_wide_fixtures",
+        TESTS,
+        &arguments.join(", "),
+        &format!("    assert {} == {expected}\n", arguments.join(" + ")),
+    )?;
     fs::write(tests.join("test_wide_fixtures.py"), source)
         .context("Failed to write generated wide fixture tests")?;
 